@@ -0,0 +1,19 @@
+import pytest
+
+from code_tests.unit_tests.forecasting_test_manager import ForecastingTestManager
+from forecasting_tools.data_models.questions import BinaryQuestion
+from forecasting_tools.forecast_bots.experiments.drivers_bot import DriversBot
+
+
+@pytest.fixture(scope="session")
+def fake_binary_question() -> BinaryQuestion:
+    return ForecastingTestManager.get_fake_binary_question()
+
+
+@pytest.fixture(scope="session")
+def drivers_bot() -> DriversBot:
+    return DriversBot(
+        research_reports_per_question=1,
+        predictions_per_research_report=1,
+        publish_reports_to_metaculus=False,
+    )
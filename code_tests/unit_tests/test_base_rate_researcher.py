@@ -1,13 +1,15 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock
+
+import pytest
 
 from forecasting_tools.agents_and_tools.research.base_rate_researcher import (
     BaseRateEstimate,
     LightweightBaseRateResearcher,
 )
+from forecasting_tools.data_models.questions import BinaryQuestion
 
 LLM_PATCH = (
-    "forecasting_tools.agents_and_tools.research."
-    "base_rate_researcher.GeneralLlm"
+    "forecasting_tools.agents_and_tools.research.base_rate_researcher.GeneralLlm"
 )
 
 
@@ -28,6 +30,9 @@ def _make_estimate(
     )
 
 
+EXPECTED_ESTIMATES = [_make_estimate(), _make_estimate("Another class", 5, 20)]
+
+
 class TestBaseRateEstimate:
     def test_format_as_markdown_with_estimates(self) -> None:
         estimates = [
@@ -51,50 +56,32 @@ class TestBaseRateEstimate:
 
 
 class TestLightweightBaseRateResearcher:
-    @patch(LLM_PATCH)
-    async def test_research_base_rates_returns_estimates(
-        self,
-        mock_llm_cls: AsyncMock,
-    ) -> None:
-        from code_tests.unit_tests.forecasting_test_manager import (
-            ForecastingTestManager,
-        )
-
-        expected = [_make_estimate(), _make_estimate("Another class", 5, 20)]
-
-        mock_instance = AsyncMock()
-        mock_instance.invoke_and_return_verified_type = AsyncMock(
-            return_value=expected
-        )
-        mock_llm_cls.return_value = mock_instance
-
-        question = ForecastingTestManager.get_fake_binary_question()
-        result = await LightweightBaseRateResearcher.research_base_rates(question)
-
-        assert len(result) == 2
-        assert result[0].reference_class == "Test reference class"
-        mock_instance.invoke_and_return_verified_type.assert_called_once()
-
-    @patch(LLM_PATCH)
-    async def test_research_base_rates_custom_count(
+    @pytest.mark.parametrize(
+        "call_kwargs, expected_count",
+        [
+            ({}, 3),
+            ({"num_base_rates": 1}, 1),
+        ],
+    )
+    async def test_research_base_rates(
         self,
-        mock_llm_cls: AsyncMock,
+        mocker: Mock,
+        call_kwargs: dict[str, int],
+        expected_count: int,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        from code_tests.unit_tests.forecasting_test_manager import (
-            ForecastingTestManager,
-        )
-
         mock_instance = AsyncMock()
         mock_instance.invoke_and_return_verified_type = AsyncMock(
-            return_value=[_make_estimate()]
+            return_value=EXPECTED_ESTIMATES
         )
-        mock_llm_cls.return_value = mock_instance
+        mocker.patch(LLM_PATCH, return_value=mock_instance)
 
-        question = ForecastingTestManager.get_fake_binary_question()
         await LightweightBaseRateResearcher.research_base_rates(
-            question, num_base_rates=1
+            fake_binary_question, **call_kwargs
         )
 
-        call_args = mock_instance.invoke_and_return_verified_type.call_args
-        prompt = call_args[0][0]
-        assert "1" in prompt
+        assert mock_instance.invoke_and_return_verified_type.call_count == 1
+        prompt, return_type = mock_instance.invoke_and_return_verified_type.call_args[0]
+        assert return_type == list[BaseRateEstimate]
+        assert fake_binary_question.question_text in prompt
+        assert f"Return exactly {expected_count} reference classes" in prompt
@@ -1,24 +1,30 @@
+import asyncio
+import math
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, Callable, Coroutine, NoReturn
+from unittest.mock import AsyncMock, MagicMock, Mock
 
-from code_tests.unit_tests.forecasting_test_manager import ForecastingTestManager
-from forecasting_tools.data_models.numeric_report import (
-    NumericDistribution,
-    Percentile,
-)
+import numpy as np
+import pytest
+
+from code_tests.unit_tests.test_base_rate_researcher import _make_estimate
+from code_tests.unit_tests.test_drivers_researcher import _make_scored_driver
+from forecasting_tools.data_models.numeric_report import NumericDistribution, Percentile
 from forecasting_tools.data_models.questions import BinaryQuestion, NumericQuestion
 from forecasting_tools.data_models.timestamped_predictions import (
     BinaryTimestampedPrediction,
     NumericTimestampedDistribution,
 )
-from forecasting_tools.forecast_bots.experiments.drivers_bot import DriversBot
+from forecasting_tools.forecast_bots.experiments.drivers_bot import (
+    NEW_WEIGHT,
+    DriversBot,
+)
 
 ASKNEWS_PATCH = (
     "forecasting_tools.forecast_bots.experiments.drivers_bot.AskNewsSearcher"
 )
-BASE_RATES_PATCH = (
-    "forecasting_tools.forecast_bots.experiments.drivers_bot.LightweightBaseRateResearcher"
-)
+BASE_RATES_PATCH = "forecasting_tools.forecast_bots.experiments.drivers_bot.LightweightBaseRateResearcher"
 DRIVERS_PATCH = (
     "forecasting_tools.forecast_bots.experiments.drivers_bot.DriversResearcher"
 )
@@ -27,426 +33,374 @@ KEY_FACTORS_PATCH = (
 )
 
 
-def _make_bot() -> DriversBot:
-    return DriversBot(
-        research_reports_per_question=1,
-        predictions_per_research_report=1,
-        publish_reports_to_metaculus=False,
-    )
+def _raise_async(exc: Exception) -> Callable[..., Coroutine[Any, Any, NoReturn]]:
+    async def raise_exc(*args: Any, **kwargs: Any) -> NoReturn:
+        raise exc
+
+    return raise_exc
+
+
+def _empty_async_mock() -> AsyncMock:
+    return AsyncMock(return_value=[])
+
+
+@dataclass(frozen=True)
+class KeyFactorStub:
+    display_text: str
+
 
+@dataclass
+class AskNewsSearcherStub:
+    news: str = "AskNews results"
 
-def _mock_asknews() -> MagicMock:
-    mock_instance = AsyncMock()
-    mock_instance.get_formatted_news_async = AsyncMock(return_value="AskNews results")
-    mock_cls = MagicMock(return_value=mock_instance)
-    return mock_cls
+    async def get_formatted_news_async(self, query: str) -> str:
+        return self.news
 
 
-def _mock_key_factors() -> list[MagicMock]:
-    mock_factor = MagicMock()
-    mock_factor.display_text = "Key factor 1 [Source](https://example.com)"
-    return [mock_factor]
+@dataclass
+class DriversBotMocks:
+    news: AskNewsSearcherStub
+    base_rates: MagicMock
+    key_factors: MagicMock
+    drivers: MagicMock
 
 
 class TestDriversBot:
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
+    @pytest.fixture(autouse=True)
+    def drivers_bot_mocks(self, mocker: Mock) -> DriversBotMocks:
+        news = AskNewsSearcherStub()
+        mocker.patch(ASKNEWS_PATCH, new=lambda *args, **kwargs: news)
+        return DriversBotMocks(
+            news=news,
+            base_rates=mocker.patch(
+                BASE_RATES_PATCH, research_base_rates=_empty_async_mock()
+            ),
+            key_factors=mocker.patch(
+                KEY_FACTORS_PATCH, find_and_sort_key_factors=_empty_async_mock()
+            ),
+            drivers=mocker.patch(DRIVERS_PATCH, research_drivers=_empty_async_mock()),
+        )
+
     async def test_run_research_includes_steep_section(
         self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
+        drivers_bot_mocks: DriversBotMocks,
+        drivers_bot: DriversBot,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        from code_tests.unit_tests.test_drivers_researcher import _make_scored_driver
-
-        mock_researcher.research_drivers = AsyncMock(
-            return_value=[_make_scored_driver("AI Progress")]
-        )
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(return_value=[])
-        mock_base_rates.research_base_rates = AsyncMock(return_value=[])
-
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
+        drivers_bot_mocks.drivers.research_drivers.return_value = [
+            _make_scored_driver("AI Progress")
+        ]
 
-        result = await bot.run_research(question)
+        result = await drivers_bot.run_research(fake_binary_question)
 
         assert "## STEEP Driver Analysis" in result
         assert "AI Progress" in result
 
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
     async def test_run_research_includes_key_factors(
         self,
-        mock_researcher: AsyncMock,
-        mock_key_factors_cls: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
+        drivers_bot_mocks: DriversBotMocks,
+        drivers_bot: DriversBot,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        from code_tests.unit_tests.test_drivers_researcher import _make_scored_driver
-
-        mock_researcher.research_drivers = AsyncMock(
-            return_value=[_make_scored_driver()]
-        )
-
-        mock_factor = MagicMock()
-        mock_factor.display_text = "Important factor [Source](https://example.com)"
-        mock_key_factors_cls.find_and_sort_key_factors = AsyncMock(
-            return_value=[mock_factor]
-        )
-        mock_base_rates.research_base_rates = AsyncMock(return_value=[])
+        drivers_bot_mocks.drivers.research_drivers.return_value = [
+            _make_scored_driver()
+        ]
 
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
+        key_factor = KeyFactorStub("Important factor [Source](https://example.com)")
+        drivers_bot_mocks.key_factors.find_and_sort_key_factors.return_value = [
+            key_factor
+        ]
 
-        result = await bot.run_research(question)
+        result = await drivers_bot.run_research(fake_binary_question)
 
         assert "## Key Factors" in result
 
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
     async def test_run_research_includes_base_rates(
         self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
+        drivers_bot_mocks: DriversBotMocks,
+        drivers_bot: DriversBot,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        from code_tests.unit_tests.test_base_rate_researcher import _make_estimate
-
-        mock_researcher.research_drivers = AsyncMock(return_value=[])
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(return_value=[])
-        mock_base_rates.research_base_rates = AsyncMock(
-            return_value=[_make_estimate("Gov shutdowns", 4, 20)]
-        )
-
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
+        drivers_bot_mocks.base_rates.research_base_rates.return_value = [
+            _make_estimate("Gov shutdowns", 4, 20)
+        ]
 
-        result = await bot.run_research(question)
+        result = await drivers_bot.run_research(fake_binary_question)
 
         assert "## Base Rate Analysis" in result
         assert "Gov shutdowns" in result
 
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
-    async def test_run_research_fallback_on_driver_failure(
+    @pytest.mark.parametrize(
+        "failing_streams",
+        [
+            ["drivers"],
+            ["key_factors"],
+            ["base_rates"],
+            ["drivers", "key_factors", "base_rates"],
+        ],
+    )
+    async def test_run_research_fallback_on_stream_failure(
         self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
+        failing_streams: list[str],
+        drivers_bot_mocks: DriversBotMocks,
+        drivers_bot: DriversBot,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        mock_researcher.research_drivers = AsyncMock(
-            side_effect=RuntimeError("Driver research failed")
-        )
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(return_value=[])
-        mock_base_rates.research_base_rates = AsyncMock(return_value=[])
-
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
-
-        result = await bot.run_research(question)
-
-        assert "## STEEP Driver Analysis" not in result
+        stream_mocks = {
+            "drivers": (
+                drivers_bot_mocks.drivers,
+                "research_drivers",
+                [_make_scored_driver()],
+            ),
+            "key_factors": (
+                drivers_bot_mocks.key_factors,
+                "find_and_sort_key_factors",
+                [KeyFactorStub("Important factor [Source](https://example.com)")],
+            ),
+            "base_rates": (
+                drivers_bot_mocks.base_rates,
+                "research_base_rates",
+                [_make_estimate("Gov shutdowns", 4, 20)],
+            ),
+        }
+        for stream, (mock_cls, method_name, success_value) in stream_mocks.items():
+            if stream in failing_streams:
+                failing_method = _raise_async(RuntimeError(f"{stream} failed"))
+                setattr(mock_cls, method_name, failing_method)
+            else:
+                getattr(mock_cls, method_name).return_value = success_value
 
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
-    async def test_run_research_fallback_on_key_factors_failure(
-        self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
-    ) -> None:
-        from code_tests.unit_tests.test_drivers_researcher import _make_scored_driver
+        result = await drivers_bot.run_research(fake_binary_question)
 
-        mock_researcher.research_drivers = AsyncMock(
-            return_value=[_make_scored_driver()]
+        assert "AskNews results" in result
+        assert ("## STEEP Driver Analysis" in result) == (
+            "drivers" not in failing_streams
         )
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(
-            side_effect=RuntimeError("Key factors failed")
+        assert ("## Key Factors" in result) == ("key_factors" not in failing_streams)
+        assert ("## Base Rate Analysis" in result) == (
+            "base_rates" not in failing_streams
         )
-        mock_base_rates.research_base_rates = AsyncMock(return_value=[])
-
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
 
-        result = await bot.run_research(question)
-
-        assert "## STEEP Driver Analysis" in result
-        assert "## Key Factors" not in result
-
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
-    async def test_run_research_fallback_on_base_rates_failure(
+    async def test_run_research_runs_streams_concurrently(
         self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
+        drivers_bot_mocks: DriversBotMocks,
+        drivers_bot: DriversBot,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        from code_tests.unit_tests.test_drivers_researcher import _make_scored_driver
-
-        mock_researcher.research_drivers = AsyncMock(
-            return_value=[_make_scored_driver()]
+        streams_in_flight = 0
+        max_streams_in_flight = 0
+
+        def track_in_flight(result: Any) -> Callable[..., Coroutine[Any, Any, Any]]:
+            async def tracked_stream(*args: Any, **kwargs: Any) -> Any:
+                nonlocal streams_in_flight, max_streams_in_flight
+                streams_in_flight += 1
+                max_streams_in_flight = max(max_streams_in_flight, streams_in_flight)
+                # Yield once so any stream started alongside this one can enter
+                await asyncio.sleep(0)
+                streams_in_flight -= 1
+                return result
+
+            return tracked_stream
+
+        drivers_bot_mocks.drivers.research_drivers.side_effect = track_in_flight([])
+        drivers_bot_mocks.key_factors.find_and_sort_key_factors.side_effect = (
+            track_in_flight([])
         )
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(return_value=[])
-        mock_base_rates.research_base_rates = AsyncMock(
-            side_effect=RuntimeError("Base rates failed")
+        drivers_bot_mocks.base_rates.research_base_rates.side_effect = track_in_flight(
+            []
         )
+        drivers_bot_mocks.news.get_formatted_news_async = track_in_flight("")
 
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
-
-        result = await bot.run_research(question)
+        await drivers_bot.run_research(fake_binary_question)
 
-        assert "## STEEP Driver Analysis" in result
-        assert "## Base Rate Analysis" not in result
+        assert max_streams_in_flight == 4
 
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
     async def test_run_research_includes_news(
         self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
+        drivers_bot_mocks: DriversBotMocks,
+        drivers_bot: DriversBot,
+        fake_binary_question: BinaryQuestion,
     ) -> None:
-        mock_researcher.research_drivers = AsyncMock(return_value=[])
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(return_value=[])
-        mock_base_rates.research_base_rates = AsyncMock(return_value=[])
+        drivers_bot_mocks.news.news = "Latest news content"
 
-        mock_asknews_instance = AsyncMock()
-        mock_asknews_instance.get_formatted_news_async = AsyncMock(
-            return_value="Latest news content"
-        )
+        result = await drivers_bot.run_research(fake_binary_question)
 
-        with patch(ASKNEWS_PATCH) as mock_asknews_cls:
-            mock_asknews_cls.return_value = mock_asknews_instance
+        assert "Latest news content" in result
 
-            bot = _make_bot()
-            question = ForecastingTestManager.get_fake_binary_question()
 
-            result = await bot.run_research(question)
+FORECAST_TIMESTAMP = datetime(2026, 1, 1, tzinfo=timezone.utc)
 
-            assert "Latest news content" in result
 
-    @patch(ASKNEWS_PATCH, new_callable=lambda: _mock_asknews)
-    @patch(BASE_RATES_PATCH)
-    @patch(KEY_FACTORS_PATCH)
-    @patch(DRIVERS_PATCH)
-    async def test_run_research_all_parallel_streams_fail_still_returns_news(
-        self,
-        mock_researcher: AsyncMock,
-        mock_key_factors: AsyncMock,
-        mock_base_rates: AsyncMock,
-        mock_asknews: MagicMock,
-    ) -> None:
-        mock_researcher.research_drivers = AsyncMock(
-            side_effect=RuntimeError("Drivers failed")
-        )
-        mock_key_factors.find_and_sort_key_factors = AsyncMock(
-            side_effect=RuntimeError("Key factors failed")
-        )
-        mock_base_rates.research_base_rates = AsyncMock(
-            side_effect=RuntimeError("Base rates failed")
-        )
+def _make_binary_question(previous_predictions: list[float] | None) -> BinaryQuestion:
+    if previous_predictions is None:
+        return BinaryQuestion(question_text="Test?", previous_forecasts=None)
+    return BinaryQuestion(
+        question_text="Test?",
+        previous_forecasts=[
+            BinaryTimestampedPrediction.model_construct(
+                prediction_in_decimal=prediction,
+                timestamp=FORECAST_TIMESTAMP,
+                timestamp_end=None,
+            )
+            for prediction in previous_predictions
+        ],
+    )
 
-        bot = _make_bot()
-        question = ForecastingTestManager.get_fake_binary_question()
 
-        result = await bot.run_research(question)
+BINARY_QUESTION_WITHOUT_PREVIOUS = _make_binary_question(None)
+BINARY_QUESTION_PREVIOUS_0_5 = _make_binary_question([0.5])
+BINARY_QUESTION_PREVIOUS_0_3 = _make_binary_question([0.3])
+BINARY_QUESTION_PREVIOUS_0_1_THEN_0_5 = _make_binary_question([0.1, 0.5])
 
-        assert "AskNews results" in result
-        assert "## STEEP Driver Analysis" not in result
-        assert "## Key Factors" not in result
-        assert "## Base Rate Analysis" not in result
 
+def _make_percentiles(values_by_percentile: dict[float, float]) -> list[Percentile]:
+    return [
+        Percentile.model_construct(percentile=percentile, value=value)
+        for percentile, value in values_by_percentile.items()
+    ]
 
-def _make_timestamp() -> datetime:
-    return datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+def _make_numeric_distribution(
+    values_by_percentile: dict[float, float],
+) -> NumericDistribution:
+    return NumericDistribution.model_construct(
+        declared_percentiles=_make_percentiles(values_by_percentile),
+        open_upper_bound=False,
+        open_lower_bound=False,
+        upper_bound=100.0,
+        lower_bound=0.0,
+        zero_point=None,
+        standardize_cdf=False,
+    )
+
+
+def _make_numeric_question(
+    previous_values_by_percentile: dict[float, float],
+) -> NumericQuestion:
+    return NumericQuestion(
+        question_text="Test?",
+        upper_bound=100.0,
+        lower_bound=0.0,
+        open_upper_bound=False,
+        open_lower_bound=False,
+        previous_forecasts=[
+            NumericTimestampedDistribution.model_construct(
+                declared_percentiles=_make_percentiles(previous_values_by_percentile),
+                open_upper_bound=False,
+                open_lower_bound=False,
+                upper_bound=100.0,
+                lower_bound=0.0,
+                zero_point=None,
+                timestamp=FORECAST_TIMESTAMP,
+                timestamp_end=None,
+            )
+        ],
+    )
 
 
 class TestDriftGuard:
-    async def test_binary_no_previous_forecast_passes_through(self) -> None:
-        bot = _make_bot()
-        question = BinaryQuestion(
-            question_text="Test?",
-            previous_forecasts=None,
+    async def test_binary_no_previous_forecast_passes_through(
+        self, drivers_bot: DriversBot
+    ) -> None:
+        result = await drivers_bot._aggregate_predictions(
+            [0.8], BINARY_QUESTION_WITHOUT_PREVIOUS
         )
-        result = await bot._aggregate_predictions([0.8], question)
         assert result == 0.8
 
-    async def test_binary_small_drift_passes_through(self) -> None:
-        bot = _make_bot()
-        question = BinaryQuestion(
-            question_text="Test?",
-            previous_forecasts=[
-                BinaryTimestampedPrediction(
-                    prediction_in_decimal=0.5,
-                    timestamp=_make_timestamp(),
-                    timestamp_end=None,
-                )
-            ],
+    async def test_binary_small_drift_passes_through(
+        self, drivers_bot: DriversBot
+    ) -> None:
+        result = await drivers_bot._aggregate_predictions(
+            [0.6], BINARY_QUESTION_PREVIOUS_0_5
         )
-        result = await bot._aggregate_predictions([0.6], question)
         assert result == 0.6
 
-    async def test_binary_large_drift_gets_dampened(self) -> None:
-        bot = _make_bot()
-        question = BinaryQuestion(
-            question_text="Test?",
-            previous_forecasts=[
-                BinaryTimestampedPrediction(
-                    prediction_in_decimal=0.3,
-                    timestamp=_make_timestamp(),
-                    timestamp_end=None,
-                )
-            ],
-        )
+    async def test_binary_large_drift_gets_dampened(
+        self, drivers_bot: DriversBot
+    ) -> None:
         # Drift of 0.5 exceeds MAX_BINARY_DRIFT (0.15)
-        result = await bot._aggregate_predictions([0.8], question)
-        # Blended: 0.6 * 0.8 + 0.4 * 0.3 = 0.48 + 0.12 = 0.60
-        assert abs(result - 0.60) < 1e-6
-
-    async def test_binary_drift_guard_uses_last_forecast(self) -> None:
-        bot = _make_bot()
-        question = BinaryQuestion(
-            question_text="Test?",
-            previous_forecasts=[
-                BinaryTimestampedPrediction(
-                    prediction_in_decimal=0.1,
-                    timestamp=_make_timestamp(),
-                    timestamp_end=None,
-                ),
-                BinaryTimestampedPrediction(
-                    prediction_in_decimal=0.5,
-                    timestamp=_make_timestamp(),
-                    timestamp_end=None,
-                ),
-            ],
+        result = await drivers_bot._aggregate_predictions(
+            [0.8], BINARY_QUESTION_PREVIOUS_0_3
         )
-        # Only compares against last (0.5), drift = 0.3 > 0.15
-        result = await bot._aggregate_predictions([0.8], question)
-        # Blended: 0.6 * 0.8 + 0.4 * 0.5 = 0.48 + 0.20 = 0.68
-        assert abs(result - 0.68) < 1e-6
-
-    async def test_numeric_large_drift_gets_dampened(self) -> None:
-        bot = _make_bot()
-
-        prev_percentiles = [
-            Percentile(percentile=0.1, value=10.0),
-            Percentile(percentile=0.5, value=30.0),
-            Percentile(percentile=0.9, value=50.0),
-        ]
-        new_percentiles = [
-            Percentile(percentile=0.1, value=30.0),
-            Percentile(percentile=0.5, value=70.0),
-            Percentile(percentile=0.9, value=90.0),
-        ]
+        # Blended: 0.6 * 0.8 + 0.4 * 0.3 = 0.48 + 0.12 = 0.60
+        assert math.isclose(result, 0.60, abs_tol=1e-6)
 
-        question = NumericQuestion(
-            question_text="Test?",
-            upper_bound=100.0,
-            lower_bound=0.0,
-            open_upper_bound=False,
-            open_lower_bound=False,
-            previous_forecasts=[
-                NumericTimestampedDistribution(
-                    declared_percentiles=prev_percentiles,
-                    open_upper_bound=False,
-                    open_lower_bound=False,
-                    upper_bound=100.0,
-                    lower_bound=0.0,
-                    zero_point=None,
-                    timestamp=_make_timestamp(),
-                    timestamp_end=None,
-                )
-            ],
+    async def test_binary_drift_guard_uses_last_forecast(
+        self, drivers_bot: DriversBot
+    ) -> None:
+        # Only compares against last (0.5), drift = 0.3 > 0.15
+        result = await drivers_bot._aggregate_predictions(
+            [0.8], BINARY_QUESTION_PREVIOUS_0_1_THEN_0_5
         )
+        # Blended: 0.6 * 0.8 + 0.4 * 0.5 = 0.48 + 0.20 = 0.68
+        assert math.isclose(result, 0.68, abs_tol=1e-6)
 
-        new_dist = NumericDistribution(
-            declared_percentiles=new_percentiles,
-            open_upper_bound=False,
-            open_lower_bound=False,
-            upper_bound=100.0,
-            lower_bound=0.0,
-            zero_point=None,
-            standardize_cdf=False,
-        )
+    async def test_numeric_large_drift_gets_dampened(
+        self, drivers_bot: DriversBot
+    ) -> None:
+        question = _make_numeric_question({0.1: 10.0, 0.5: 30.0, 0.9: 50.0})
+        new_dist = _make_numeric_distribution({0.1: 30.0, 0.5: 70.0, 0.9: 90.0})
 
-        result = await bot._aggregate_predictions([new_dist], question)
+        result = await drivers_bot._aggregate_predictions([new_dist], question)
         assert isinstance(result, NumericDistribution)
         # Median drift = |70 - 30| / 100 = 0.4 > 0.15, so blending occurs
         # Blended median: 0.6 * 70 + 0.4 * 30 = 42 + 12 = 54
-        result_values = {
-            p.percentile: p.value for p in result.declared_percentiles
-        }
+        result_values = {p.percentile: p.value for p in result.declared_percentiles}
         # Check that blending moved the median closer to previous
         # The exact value depends on from_question standardization,
         # but raw blended p50 should be ~54 (between 30 and 70)
-        p50_candidates = [
-            v for p, v in result_values.items() if abs(p - 0.5) < 0.01
-        ]
+        p50_candidates = [v for p, v in result_values.items() if abs(p - 0.5) < 0.01]
         if p50_candidates:
             assert 30.0 < p50_candidates[0] < 70.0
 
-    async def test_numeric_small_drift_passes_through(self) -> None:
-        bot = _make_bot()
+    async def test_numeric_blend_moves_median_by_new_weight(
+        self, drivers_bot: DriversBot
+    ) -> None:
+        question = _make_numeric_question({0.1: 10.0, 0.5: 30.0, 0.9: 50.0})
+        new_dist = _make_numeric_distribution({0.1: 30.0, 0.5: 70.0, 0.9: 90.0})
 
-        prev_percentiles = [
-            Percentile(percentile=0.1, value=40.0),
-            Percentile(percentile=0.5, value=50.0),
-            Percentile(percentile=0.9, value=60.0),
-        ]
-        new_percentiles = [
-            Percentile(percentile=0.1, value=42.0),
-            Percentile(percentile=0.5, value=55.0),
-            Percentile(percentile=0.9, value=63.0),
-        ]
+        result = await drivers_bot._aggregate_predictions([new_dist], question)
+        assert isinstance(result, NumericDistribution)
+        result_median = np.interp(
+            0.5,
+            [p.percentile for p in result.declared_percentiles],
+            [p.value for p in result.declared_percentiles],
+        )
+        expected_median = NEW_WEIGHT * 70.0 + (1 - NEW_WEIGHT) * 30.0
+        assert math.isclose(result_median, expected_median, abs_tol=0.5)
 
-        question = NumericQuestion(
-            question_text="Test?",
-            upper_bound=100.0,
-            lower_bound=0.0,
-            open_upper_bound=False,
-            open_lower_bound=False,
-            previous_forecasts=[
-                NumericTimestampedDistribution(
-                    declared_percentiles=prev_percentiles,
-                    open_upper_bound=False,
-                    open_lower_bound=False,
-                    upper_bound=100.0,
-                    lower_bound=0.0,
-                    zero_point=None,
-                    timestamp=_make_timestamp(),
-                    timestamp_end=None,
-                )
-            ],
+    @pytest.mark.parametrize("expand_to_full_cdf", [False, True])
+    async def test_numeric_blend_across_different_percentile_sets(
+        self, expand_to_full_cdf: bool, drivers_bot: DriversBot
+    ) -> None:
+        # 3 previous percentiles against 5 new ones, or the 201-point CDF
+        # the template bot aggregates to
+        question = _make_numeric_question({0.1: 10.0, 0.5: 30.0, 0.9: 50.0})
+        new_dist = NumericDistribution.from_question(
+            _make_percentiles(
+                {0.1: 40.0, 0.25: 55.0, 0.5: 70.0, 0.75: 80.0, 0.9: 88.0}
+            ),
+            question,
         )
+        if expand_to_full_cdf:
+            new_dist = NumericDistribution.from_question(new_dist.get_cdf(), question)
 
-        new_dist = NumericDistribution(
-            declared_percentiles=new_percentiles,
-            open_upper_bound=False,
-            open_lower_bound=False,
-            upper_bound=100.0,
-            lower_bound=0.0,
-            zero_point=None,
-            standardize_cdf=False,
+        result = await drivers_bot._aggregate_predictions([new_dist], question)
+        assert isinstance(result, NumericDistribution)
+        NumericDistribution.model_validate(result.model_dump())
+        result_median = np.interp(
+            0.5,
+            [p.percentile for p in result.declared_percentiles],
+            [p.value for p in result.declared_percentiles],
         )
+        expected_median = NEW_WEIGHT * 70.0 + (1 - NEW_WEIGHT) * 30.0
+        assert math.isclose(result_median, expected_median, abs_tol=0.5)
+
+    async def test_numeric_small_drift_passes_through(
+        self, drivers_bot: DriversBot
+    ) -> None:
+        question = _make_numeric_question({0.1: 40.0, 0.5: 50.0, 0.9: 60.0})
+        new_dist = _make_numeric_distribution({0.1: 42.0, 0.5: 55.0, 0.9: 63.0})
 
-        result = await bot._aggregate_predictions([new_dist], question)
+        result = await drivers_bot._aggregate_predictions([new_dist], question)
         assert isinstance(result, NumericDistribution)
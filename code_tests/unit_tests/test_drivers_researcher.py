@@ -1,4 +1,7 @@
-from unittest.mock import AsyncMock, patch
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -17,17 +20,51 @@ from forecasting_tools.agents_and_tools.research.drivers_researcher import (
     SignalEvidence,
     SteepCategory,
 )
+from forecasting_tools.data_models.questions import BinaryQuestion
+
+LLM_PATCH = "forecasting_tools.agents_and_tools.research.drivers_researcher.GeneralLlm"
+
+LlmResponsesByType = dict[Any, list]
+
+SAMPLE_SCENARIO = DominanceScenario(
+    scenario_description="Test scenario",
+    timescale_plausibility="medium",
+    system_effects=["Effect 1"],
+)
+SAMPLE_PRECONDITIONS = [
+    Precondition(
+        description="Pre 1",
+        why_necessary="Why 1",
+        status=PreconditionStatus.EMERGING,
+    ),
+    Precondition(
+        description="Pre 2",
+        why_necessary="Why 2",
+        status=PreconditionStatus.ABSENT,
+    ),
+]
+
+
+@dataclass
+class FakeVerifiedTypeLlm:
+    responses: LlmResponsesByType = field(default_factory=dict)
+
+    async def invoke_and_return_verified_type(
+        self, prompt: str, normal_complex_or_pydantic_type: Any
+    ) -> list:
+        return self.responses.get(normal_complex_or_pydantic_type, [])
 
 
 def _make_candidate(
     name: str = "Test Driver",
     category: SteepCategory = SteepCategory.TECHNOLOGICAL,
+    directionality: Directionality = Directionality.ACCELERATING,
 ) -> CandidateDriver:
-    return CandidateDriver(
+    return CandidateDriver.model_construct(
         name=name,
         category=category,
         mechanism="Test mechanism",
-        directionality=Directionality.ACCELERATING,
+        directionality=directionality,
         initial_relevance=0.8,
     )
 
@@ -35,25 +72,30 @@ def _make_candidate(
 def _make_scored_driver(
     name: str = "Test Driver",
     category: SteepCategory = SteepCategory.TECHNOLOGICAL,
+    directionality: Directionality = Directionality.ACCELERATING,
+    strength: DriverStrength = DriverStrength.STRONG,
 ) -> ScoredDriver:
-    return ScoredDriver(
+    return ScoredDriver.model_construct(
         name=name,
         category=category,
         mechanism="Test mechanism",
-        directionality=Directionality.ACCELERATING,
+        directionality=directionality,
         direction_of_pressure="pushes toward Yes",
-        strength=DriverStrength.STRONG,
+        strength=strength,
         uncertainty="Low uncertainty",
     )
 
 
 class TestPydanticModels:
-    def test_candidate_driver_validation(self) -> None:
-        driver = _make_candidate()
-        assert driver.name == "Test Driver"
-        assert driver.initial_relevance == 0.8
-
     def test_candidate_driver_relevance_bounds(self) -> None:
+        driver = CandidateDriver(
+            name="Test Driver",
+            category=SteepCategory.TECHNOLOGICAL,
+            mechanism="Test mechanism",
+            directionality=Directionality.ACCELERATING,
+            initial_relevance=0.8,
+        )
+        assert driver.initial_relevance == 0.8
         with pytest.raises(Exception):
             CandidateDriver(
                 name="Bad",
@@ -63,6 +105,20 @@ class TestPydanticModels:
                 initial_relevance=1.5,
             )
 
+    def test_candidate_driver_accepts_llm_casing_and_aliases(self) -> None:
+        driver = CandidateDriver.model_validate(
+            {
+                "name": "Test Driver",
+                "category": "Social",
+                "mechanism": "Test mechanism",
+                "trend": "ACCELERATING",
+                "relevance": 0.5,
+            }
+        )
+        assert driver.category == SteepCategory.SOCIAL
+        assert driver.directionality == Directionality.ACCELERATING
+        assert driver.initial_relevance == 0.5
+
     def test_signal_evidence_optional_recency(self) -> None:
         signal = SignalEvidence(summary="s", citation="c")
         assert signal.recency is None
@@ -74,6 +130,11 @@ class TestPydanticModels:
         assert "Technological" in text
         assert "strong" in text
 
+    def test_scored_driver_display_text_follows_updates(self) -> None:
+        driver = _make_scored_driver("Driver A")
+        renamed = driver.model_copy(update={"name": "Driver B"})
+        assert "**Driver B**" in renamed.display_text
+
     def test_turn_drivers_into_markdown_empty(self) -> None:
         result = ScoredDriver.turn_drivers_into_markdown([])
         assert result == "No drivers identified."
@@ -88,8 +149,36 @@ class TestPydanticModels:
         assert "Driver B" in result
         assert result.startswith("- ")
 
-    def test_steep_category_values(self) -> None:
-        assert len(SteepCategory) == 5
+    @pytest.mark.parametrize(
+        "enum_cls, expected_values",
+        [
+            (
+                SteepCategory,
+                {"social", "technological", "economic", "environmental", "political"},
+            ),
+            (PreconditionStatus, {"emerging", "stable", "absent", "contrary"}),
+        ],
+    )
+    def test_enum_values(self, enum_cls: type[Enum], expected_values: set[str]) -> None:
+        assert {member.value for member in enum_cls} == expected_values
+
+    @pytest.mark.parametrize(
+        "raw_value, expected_member",
+        [
+            ("SOCIAL", SteepCategory.SOCIAL),
+            ("Decelerating", Directionality.DECELERATING),
+            ("STRONG", DriverStrength.STRONG),
+            ("Emerging", PreconditionStatus.EMERGING),
+        ],
+    )
+    def test_enum_lookup_ignores_case(
+        self, raw_value: str, expected_member: Enum
+    ) -> None:
+        assert type(expected_member)(raw_value) is expected_member
+
+    def test_enum_lookup_rejects_unknown_value(self) -> None:
+        with pytest.raises(ValueError):
+            DriverStrength("overwhelming")
 
     def test_driver_assessment_model(self) -> None:
         assessment = DriverAssessment(
@@ -110,109 +199,97 @@ class TestPydanticModels:
         assert assessment.viability_score == 0.8
 
 
-class TestDriversResearcher:
-    @patch("forecasting_tools.agents_and_tools.research.drivers_researcher.GeneralLlm")
-    async def test_research_drivers_success(
-        self, mock_llm_cls: AsyncMock
-    ) -> None:
-        from code_tests.unit_tests.forecasting_test_manager import (
-            ForecastingTestManager,
+@pytest.fixture(scope="session")
+def canned_llm_responses() -> LlmResponsesByType:
+    candidates = [_make_candidate(f"Driver {i}") for i in range(16)]
+    precondition_assessments = [
+        PreconditionAssessment.model_construct(
+            index=i,
+            dominance_plausibility="high",
+            precondition_summary="Met",
+            viability_score=0.8,
+        )
+        for i in range(10)
+    ]
+    driver_assessments = [
+        DriverAssessment.model_construct(
+            index=i,
+            direction_of_pressure="pushes Yes",
+            strength=DriverStrength.STRONG,
+            uncertainty="low",
         )
+        for i in range(8)
+    ]
+    return {
+        list[CandidateDriver]: candidates,
+        list[PreconditionAssessment]: precondition_assessments,
+        list[DriverAssessment]: driver_assessments,
+    }
 
-        question = ForecastingTestManager.get_fake_binary_question()
 
-        candidates = [_make_candidate(f"Driver {i}") for i in range(16)]
-        precondition_assessments = [
-            PreconditionAssessment(
-                index=i,
-                dominance_plausibility="high",
-                precondition_summary="Met",
-                viability_score=0.8,
-            )
-            for i in range(10)
-        ]
-        driver_assessments = [
-            DriverAssessment(
-                index=i,
-                direction_of_pressure="pushes Yes",
-                strength=DriverStrength.STRONG,
-                uncertainty="low",
-            )
-            for i in range(8)
-        ]
+class TestDriversResearcher:
+    @pytest.fixture(autouse=True)
+    def fake_llm(self, mocker: Mock) -> FakeVerifiedTypeLlm:
+        fake_llm = FakeVerifiedTypeLlm()
+        mocker.patch(LLM_PATCH, return_value=fake_llm)
+        return fake_llm
 
-        mock_llm_instance = AsyncMock()
-        mock_llm_instance.invoke_and_return_verified_type = AsyncMock(
-            side_effect=[candidates, precondition_assessments, driver_assessments]
-        )
-        mock_llm_cls.return_value = mock_llm_instance
+    async def test_research_drivers_success(
+        self,
+        fake_llm: FakeVerifiedTypeLlm,
+        fake_binary_question: BinaryQuestion,
+        canned_llm_responses: LlmResponsesByType,
+    ) -> None:
+        fake_llm.responses = canned_llm_responses
 
-        result = await DriversResearcher.research_drivers(question)
+        result = await DriversResearcher.research_drivers(fake_binary_question)
         assert len(result) <= 8
         assert all(isinstance(d, ScoredDriver) for d in result)
 
-    @patch("forecasting_tools.agents_and_tools.research.drivers_researcher.GeneralLlm")
-    async def test_low_viability_filters_candidates(
-        self, mock_llm_cls: AsyncMock
+    async def test_score_and_select_caps_at_num_drivers(
+        self,
+        fake_llm: FakeVerifiedTypeLlm,
+        fake_binary_question: BinaryQuestion,
+        canned_llm_responses: LlmResponsesByType,
     ) -> None:
-        from code_tests.unit_tests.forecasting_test_manager import (
-            ForecastingTestManager,
-        )
-
-        question = ForecastingTestManager.get_fake_binary_question()
-
-        candidates = [_make_candidate(f"Driver {i}") for i in range(4)]
-        # All candidates get low viability scores
-        precondition_assessments = [
-            PreconditionAssessment(
-                index=i,
-                dominance_plausibility="very_low",
-                precondition_summary="Not met",
-                viability_score=0.1,
-            )
-            for i in range(4)
-        ]
+        fake_llm.responses = canned_llm_responses
 
-        mock_llm_instance = AsyncMock()
-        mock_llm_instance.invoke_and_return_verified_type = AsyncMock(
-            side_effect=[candidates, precondition_assessments]
+        result = await DriversResearcher.research_drivers(
+            fake_binary_question, num_drivers_to_return=2
         )
-        mock_llm_cls.return_value = mock_llm_instance
+        assert [d.name for d in result] == ["Driver 0", "Driver 1"]
+
+    async def test_low_viability_filters_candidates(
+        self, fake_llm: FakeVerifiedTypeLlm, fake_binary_question: BinaryQuestion
+    ) -> None:
+        fake_llm.responses = {
+            list[CandidateDriver]: [_make_candidate(f"Driver {i}") for i in range(4)],
+            # All candidates get low viability scores
+            list[PreconditionAssessment]: [
+                PreconditionAssessment.model_construct(
+                    index=i,
+                    dominance_plausibility="very_low",
+                    precondition_summary="Not met",
+                    viability_score=0.1,
+                )
+                for i in range(4)
+            ],
+        }
 
         result = await DriversResearcher.research_drivers(
-            question, num_drivers_to_return=4
+            fake_binary_question, num_drivers_to_return=4
         )
         # All filtered out by low viability, _score_and_select gets empty list
         assert len(result) == 0
 
-    @patch("forecasting_tools.agents_and_tools.research.drivers_researcher.GeneralLlm")
     async def test_empty_candidates_returns_empty(
-        self, mock_llm_cls: AsyncMock
+        self, fake_llm: FakeVerifiedTypeLlm, fake_binary_question: BinaryQuestion
     ) -> None:
-        from code_tests.unit_tests.forecasting_test_manager import (
-            ForecastingTestManager,
-        )
-
-        question = ForecastingTestManager.get_fake_binary_question()
-
-        mock_llm_instance = AsyncMock()
-        mock_llm_instance.invoke_and_return_verified_type = AsyncMock(
-            return_value=[]
-        )
-        mock_llm_cls.return_value = mock_llm_instance
-
-        result = await DriversResearcher.research_drivers(question)
+        result = await DriversResearcher.research_drivers(fake_binary_question)
         assert result == []
 
 
 class TestPreconditionModels:
-    def test_precondition_status_enum(self) -> None:
-        assert len(PreconditionStatus) == 4
-        assert PreconditionStatus.EMERGING.value == "emerging"
-        assert PreconditionStatus.STABLE.value == "stable"
-        assert PreconditionStatus.ABSENT.value == "absent"
-        assert PreconditionStatus.CONTRARY.value == "contrary"
-
     def test_precondition_model(self) -> None:
         precondition = Precondition(
             description="Test precondition",
@@ -244,27 +321,10 @@ class TestPreconditionModels:
         assert len(scenario.system_effects) == 2
 
     def test_precondition_analysis_model(self) -> None:
-        scenario = DominanceScenario(
-            scenario_description="Test scenario",
-            timescale_plausibility="medium",
-            system_effects=["Effect 1"],
-        )
-        preconditions = [
-            Precondition(
-                description="Pre 1",
-                why_necessary="Why 1",
-                status=PreconditionStatus.EMERGING,
-            ),
-            Precondition(
-                description="Pre 2",
-                why_necessary="Why 2",
-                status=PreconditionStatus.ABSENT,
-            ),
-        ]
         analysis = PreconditionAnalysis(
             driver_name="Test Driver",
-            dominance_scenario=scenario,
-            preconditions=preconditions,
+            dominance_scenario=SAMPLE_SCENARIO,
+            preconditions=SAMPLE_PRECONDITIONS,
             precondition_alignment_score=0.5,
             overall_emergence_strength="moderate",
         )
@@ -273,15 +333,10 @@ class TestPreconditionModels:
         assert len(analysis.preconditions) == 2
 
     def test_precondition_analysis_score_bounds(self) -> None:
-        scenario = DominanceScenario(
-            scenario_description="Test",
-            timescale_plausibility="low",
-            system_effects=[],
-        )
         with pytest.raises(Exception):
             PreconditionAnalysis(
                 driver_name="Bad",
-                dominance_scenario=scenario,
+                dominance_scenario=SAMPLE_SCENARIO,
                 preconditions=[],
                 precondition_alignment_score=1.5,
                 overall_emergence_strength="weak",
@@ -289,26 +344,25 @@ class TestPreconditionModels:
 
 
 class TestLlmPreconditionValidation:
-    @patch("forecasting_tools.agents_and_tools.research.drivers_researcher.GeneralLlm")
     async def test_llm_precondition_validation_filters_by_viability(
-        self, mock_llm_cls: AsyncMock
+        self, mocker: Mock, fake_binary_question: BinaryQuestion
     ) -> None:
         candidates = [_make_candidate(f"Driver {i}") for i in range(3)]
 
         assessments = [
-            PreconditionAssessment(
+            PreconditionAssessment.model_construct(
                 index=0,
                 dominance_plausibility="high",
                 precondition_summary="Met",
                 viability_score=0.9,
             ),
-            PreconditionAssessment(
+            PreconditionAssessment.model_construct(
                 index=1,
                 dominance_plausibility="low",
                 precondition_summary="Not met",
                 viability_score=0.1,
             ),
-            PreconditionAssessment(
+            PreconditionAssessment.model_construct(
                 index=2,
                 dominance_plausibility="medium",
                 precondition_summary="Partially",
@@ -320,7 +374,7 @@ class TestLlmPreconditionValidation:
         mock_llm_instance.invoke_and_return_verified_type = AsyncMock(
             return_value=assessments
         )
-        mock_llm_cls.return_value = mock_llm_instance
+        mocker.patch(LLM_PATCH, return_value=mock_llm_instance)
 
         validated = await DriversResearcher._llm_precondition_validation(
             "Test question", candidates
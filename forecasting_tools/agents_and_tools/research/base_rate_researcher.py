@@ -58,9 +58,7 @@ class BaseRateEstimate(BaseModel):
     reference_class: str = Field(
         description="e.g., 'US government shutdowns since 1976'"
     )
-    numerator_description: str = Field(
-        description="e.g., 'Shutdowns lasting >2 weeks'"
-    )
+    numerator_description: str = Field(description="e.g., 'Shutdowns lasting >2 weeks'")
     denominator_description: str = Field(
         description="e.g., 'Total government shutdowns'"
     )
@@ -81,12 +79,12 @@ class BaseRateEstimate(BaseModel):
     def format_as_markdown(cls, estimates: list[BaseRateEstimate]) -> str:
         if not estimates:
             return "No base rates identified."
-        lines: list[str] = []
-        for est in estimates:
-            lines.append(
+        return "\n".join(
+            [
                 f"- **{est.reference_class}** ({est.time_period}): "
                 f"{est.numerator}/{est.denominator} = "
                 f"{est.historical_rate:.0%}. "
                 f"{est.relevance_reasoning}"
-            )
-        return "\n".join(lines)
+                for est in estimates
+            ]
+        )
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
+from typing import Self
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AliasChoices, BaseModel, Field
 
 from forecasting_tools.ai_models.general_llm import GeneralLlm
 from forecasting_tools.helpers.metaculus_api import MetaculusQuestion
@@ -32,9 +33,7 @@ class DriversResearcher:
         )
 
         # Phase A2: LLM precondition validation (1 Opus call)
-        validated = await cls._llm_precondition_validation(
-            question_details, candidates
-        )
+        validated = await cls._llm_precondition_validation(question_details, candidates)
         logger.info(
             f"Phase A2: {len(validated)} drivers passed precondition validation"
         )
@@ -96,10 +95,12 @@ class DriversResearcher:
             return []
 
         candidate_list = "\n".join(
-            f"{i}. [{c.category.value}] {c.name} "
-            f"(relevance: {c.initial_relevance}, {c.directionality.value})\n"
-            f"   Mechanism: {c.mechanism}"
-            for i, c in enumerate(candidates)
+            [
+                f"{i}. [{c.category.value}] {c.name} "
+                f"(relevance: {c.initial_relevance}, {c.directionality.value})\n"
+                f"   Mechanism: {c.mechanism}"
+                for i, c in enumerate(candidates)
+            ]
         )
 
         prompt = clean_indents(
@@ -136,22 +137,18 @@ class DriversResearcher:
             """
         )
 
-        llm = GeneralLlm(
-            model="openrouter/anthropic/claude-opus-4.6", temperature=0.3
-        )
+        llm = GeneralLlm(model="openrouter/anthropic/claude-opus-4.6", temperature=0.3)
         assessments = await llm.invoke_and_return_verified_type(
             prompt, list[PreconditionAssessment]
         )
 
-        validated = []
-        for assessment in assessments:
-            if (
-                0 <= assessment.index < len(candidates)
-                and assessment.viability_score >= 0.3
-            ):
-                validated.append(candidates[assessment.index])
-
-        return validated
+        num_candidates = len(candidates)
+        return [
+            candidates[assessment.index]
+            for assessment in assessments
+            if 0 <= assessment.index < num_candidates
+            and assessment.viability_score >= 0.3
+        ]
 
     @classmethod
     async def _score_and_select(
@@ -164,9 +161,11 @@ class DriversResearcher:
             return []
 
         candidate_list = "\n".join(
-            f"{i}. [{c.category.value}] {c.name} ({c.directionality.value})\n"
-            f"   Mechanism: {c.mechanism}"
-            for i, c in enumerate(candidates)
+            [
+                f"{i}. [{c.category.value}] {c.name} ({c.directionality.value})\n"
+                f"   Mechanism: {c.mechanism}"
+                for i, c in enumerate(candidates)
+            ]
         )
 
         prompt = clean_indents(
@@ -175,7 +174,7 @@ class DriversResearcher:
 
             1. **direction_of_pressure**: How does this driver push the question
                outcome? (e.g. "pushes toward Yes", "increases the value", etc.)
-            2. **strength**: WEAK, MODERATE, or STRONG
+            2. **strength**: weak, moderate, or strong
             3. **uncertainty**: A brief note on how certain we are about this
                driver's effect.
 
@@ -194,19 +193,21 @@ class DriversResearcher:
             """
         )
 
-        llm = GeneralLlm(
-            model="openrouter/anthropic/claude-opus-4.6", temperature=0
-        )
+        llm = GeneralLlm(model="openrouter/anthropic/claude-opus-4.6", temperature=0)
         assessments = await llm.invoke_and_return_verified_type(
             prompt, list[DriverAssessment]
         )
 
-        scored_drivers = []
+        num_candidates = len(candidates)
+        scored_drivers: list[ScoredDriver] = []
         for assessment in assessments:
-            if 0 <= assessment.index < len(candidates):
+            if len(scored_drivers) >= num_to_return:
+                break
+            if 0 <= assessment.index < num_candidates:
                 c = candidates[assessment.index]
+                # Both sources were validated when parsed from the LLM response
                 scored_drivers.append(
-                    ScoredDriver(
+                    ScoredDriver.model_construct(
                         name=c.name,
                         category=c.category,
                         mechanism=c.mechanism,
@@ -217,58 +218,39 @@ class DriversResearcher:
                     )
                 )
 
-        return scored_drivers[:num_to_return]
+        return scored_drivers
 
 
-class SteepCategory(str, Enum):
+class _CaseInsensitiveEnum(str, Enum):
+    @classmethod
+    def _missing_(cls, value: object) -> Self | None:
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
+
+class SteepCategory(_CaseInsensitiveEnum):
     SOCIAL = "social"
     TECHNOLOGICAL = "technological"
     ECONOMIC = "economic"
     ENVIRONMENTAL = "environmental"
     POLITICAL = "political"
 
-    @classmethod
-    def _missing_(cls, value: object) -> SteepCategory | None:
-        if isinstance(value, str):
-            lowered = value.lower()
-            for member in cls:
-                if member.value == lowered:
-                    return member
-        return None
 
-
-class Directionality(str, Enum):
+class Directionality(_CaseInsensitiveEnum):
     ACCELERATING = "accelerating"
     DECELERATING = "decelerating"
     STABLE = "stable"
     UNCLEAR = "unclear"
 
-    @classmethod
-    def _missing_(cls, value: object) -> Directionality | None:
-        if isinstance(value, str):
-            lowered = value.lower()
-            for member in cls:
-                if member.value == lowered:
-                    return member
-        return None
-
 
-class DriverStrength(str, Enum):
+class DriverStrength(_CaseInsensitiveEnum):
     WEAK = "weak"
     MODERATE = "moderate"
     STRONG = "strong"
 
-    @classmethod
-    def _missing_(cls, value: object) -> DriverStrength | None:
-        if isinstance(value, str):
-            lowered = value.lower()
-            for member in cls:
-                if member.value == lowered:
-                    return member
-        return None
-
 
-class PreconditionStatus(str, Enum):
+class PreconditionStatus(_CaseInsensitiveEnum):
     EMERGING = "emerging"
     STABLE = "stable"
     ABSENT = "absent"
@@ -305,20 +287,15 @@ class PreconditionAssessment(BaseModel):
 
 
 class CandidateDriver(BaseModel):
-    model_config = {"populate_by_name": True}
-
     name: str
     category: SteepCategory
     mechanism: str
-    directionality: Directionality = Field(validation_alias="trend")
-    initial_relevance: float = Field(ge=0.0, le=1.0, validation_alias="relevance")
-
-    @field_validator("directionality", mode="before")
-    @classmethod
-    def _coerce_directionality(cls, v: object) -> object:
-        if isinstance(v, str):
-            return v.lower()
-        return v
+    directionality: Directionality = Field(
+        validation_alias=AliasChoices("directionality", "trend")
+    )
+    initial_relevance: float = Field(
+        ge=0.0, le=1.0, validation_alias=AliasChoices("initial_relevance", "relevance")
+    )
 
 
 class SignalEvidence(BaseModel):
@@ -348,10 +325,7 @@ class ScoredDriver(BaseModel):
     def turn_drivers_into_markdown(cls, drivers: list[ScoredDriver]) -> str:
         if not drivers:
             return "No drivers identified."
-        lines: list[str] = []
-        for driver in drivers:
-            lines.append(f"- {driver.display_text}")
-        return "\n".join(lines)
+        return "\n".join([f"- {driver.display_text}" for driver in drivers])
 
 
 class DriverAssessment(BaseModel):
@@ -1,11 +1,12 @@
 import ast
+import functools
 import json
 import logging
 import re
 from abc import ABC
 from typing import Any, TypeVar, get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from forecasting_tools.ai_models.model_interfaces.ai_model import AiModel
 from forecasting_tools.util.misc import (
@@ -141,17 +142,15 @@ class OutputsText(AiModel, ABC):
 
         if is_list_of_pydantic_models:
             pydantic_model_type: type[BaseModel] = inner_types[0]
-            list_of_validated_objects: list[BaseModel] = []
-            list_of_dicts_from_response = cls.__extract_json_from_text(response)
-            for item in list_of_dicts_from_response:
-                pydantic_object = pydantic_model_type.model_validate(item)
-                list_of_validated_objects.append(pydantic_object)
-            final_response = list_of_validated_objects
+            json_string = cls.__extract_json_string_from_text(response)
+            final_response = _get_list_type_adapter(pydantic_model_type).validate_json(
+                json_string
+            )
         elif is_pydantic_model:
             assert issubclass(normal_complex_or_pydantic_type, BaseModel)
-            model_as_json = cls.__extract_json_from_text(response)
-            response_as_model = normal_complex_or_pydantic_type.model_validate(
-                model_as_json
+            json_string = cls.__extract_json_string_from_text(response)
+            response_as_model = normal_complex_or_pydantic_type.model_validate_json(
+                json_string
             )
             final_response = response_as_model
         else:
@@ -218,13 +217,16 @@ class OutputsText(AiModel, ABC):
 
         return response_loaded_as_string
 
+    @classmethod
+    def __extract_json_from_text(cls, text: str) -> dict | list:
+        json_string = cls.__extract_json_string_from_text(text)
+        return json.loads(json_string)
+
     @staticmethod
-    def __extract_json_from_text(text: str) -> dict | list:
+    def __extract_json_string_from_text(text: str) -> str:
         json_match = re.search(r"(\{.*\}|\[.*\])", text, re.DOTALL)
         if json_match:
-            json_string = json_match.group(0)
-            json_loaded = json.loads(json_string)
-            return json_loaded
+            return json_match.group(0)
         else:
             raise ValueError("No JSON found in the text")
 
@@ -259,6 +261,13 @@ class OutputsText(AiModel, ABC):
             )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_list_type_adapter(
+    pydantic_model_type: type[BaseModel],
+) -> TypeAdapter[list[BaseModel]]:
+    return TypeAdapter(list[pydantic_model_type])
+
+
 _PYDANTIC_FORMAT_INSTRUCTIONS = """
 The output should be formatted as a unified JSON object that conforms to the JSON schema below. If multiple json instances are requested give them as a unified list.
 
@@ -1,6 +1,8 @@
 import asyncio
 import logging
 
+import numpy as np
+
 from forecasting_tools.agents_and_tools.research.base_rate_researcher import (
     BaseRateEstimate,
     LightweightBaseRateResearcher,
@@ -15,10 +17,7 @@ from forecasting_tools.agents_and_tools.research.key_factors_researcher import (
 )
 from forecasting_tools.ai_models.general_llm import GeneralLlm
 from forecasting_tools.data_models.data_organizer import PredictionTypes
-from forecasting_tools.data_models.numeric_report import (
-    NumericDistribution,
-    Percentile,
-)
+from forecasting_tools.data_models.numeric_report import NumericDistribution, Percentile
 from forecasting_tools.data_models.questions import (
     BinaryQuestion,
     MetaculusQuestion,
@@ -36,6 +35,14 @@ MAX_NUMERIC_DRIFT = 0.15
 NEW_WEIGHT = 0.6
 
 
+def _interpolate_median(percentiles: list[Percentile]) -> float:
+    return float(
+        np.interp(
+            0.5, [p.percentile for p in percentiles], [p.value for p in percentiles]
+        )
+    )
+
+
 class DriversBot(SpringTemplateBot2026):
 
     @classmethod
@@ -68,90 +75,85 @@ class DriversBot(SpringTemplateBot2026):
 
         if isinstance(question, BinaryQuestion):
             assert isinstance(aggregate, float)
-            previous = question.previous_forecasts[-1].prediction_in_decimal
-            drift = abs(aggregate - previous)
-            if drift > MAX_BINARY_DRIFT:
-                aggregate = NEW_WEIGHT * aggregate + (1 - NEW_WEIGHT) * previous
-                aggregate = max(0.001, min(0.999, aggregate))
-                logger.info(
-                    f"Drift guard: binary drift {drift:.3f} exceeded "
-                    f"{MAX_BINARY_DRIFT}, blended to {aggregate:.3f}"
-                )
-
-        elif isinstance(question, NumericQuestion):
+            return self._dampen_binary_drift(aggregate, question)
+        if isinstance(question, NumericQuestion):
             assert isinstance(aggregate, NumericDistribution)
-            prev_dist = question.previous_forecasts[-1]
-            prev_percentiles = {
-                p.percentile: p.value
-                for p in prev_dist.declared_percentiles
-            }
-            new_percentiles = {
-                p.percentile: p.value
-                for p in aggregate.declared_percentiles
-            }
-
-            # Compare medians to decide if dampening is needed
-            common_points = sorted(
-                set(prev_percentiles.keys()) & set(new_percentiles.keys())
-            )
-            if common_points:
-                mid_idx = len(common_points) // 2
-                mid_pct = common_points[mid_idx]
-                prev_median = prev_percentiles[mid_pct]
-                new_median = new_percentiles[mid_pct]
-                range_span = question.upper_bound - question.lower_bound
-                if range_span > 0:
-                    relative_drift = abs(new_median - prev_median) / range_span
-                    if relative_drift > MAX_NUMERIC_DRIFT:
-                        blended = [
-                            Percentile(
-                                percentile=p.percentile,
-                                value=(
-                                    NEW_WEIGHT * p.value
-                                    + (1 - NEW_WEIGHT)
-                                    * prev_percentiles.get(
-                                        p.percentile, p.value
-                                    )
-                                ),
-                            )
-                            for p in aggregate.declared_percentiles
-                        ]
-                        aggregate = NumericDistribution(
-                            declared_percentiles=blended,
-                            open_upper_bound=aggregate.open_upper_bound,
-                            open_lower_bound=aggregate.open_lower_bound,
-                            upper_bound=aggregate.upper_bound,
-                            lower_bound=aggregate.lower_bound,
-                            zero_point=aggregate.zero_point,
-                            cdf_size=aggregate.cdf_size,
-                            standardize_cdf=False,
-                            is_date=aggregate.is_date,
-                        )
-                        aggregate = NumericDistribution.from_question(
-                            aggregate.declared_percentiles, question
-                        )
-                        logger.info(
-                            f"Drift guard: numeric drift {relative_drift:.3f} "
-                            f"exceeded {MAX_NUMERIC_DRIFT}, blended CDF"
-                        )
-
+            return self._dampen_numeric_drift(aggregate, question)
         return aggregate
 
+    @classmethod
+    def _dampen_binary_drift(cls, aggregate: float, question: BinaryQuestion) -> float:
+        assert question.previous_forecasts
+        previous = question.previous_forecasts[-1].prediction_in_decimal
+        drift = abs(aggregate - previous)
+        if drift <= MAX_BINARY_DRIFT:
+            return aggregate
+
+        blended = NEW_WEIGHT * aggregate + (1 - NEW_WEIGHT) * previous
+        blended = max(0.001, min(0.999, blended))
+        logger.info(
+            f"Drift guard: binary drift {drift:.3f} exceeded "
+            f"{MAX_BINARY_DRIFT}, blended to {blended:.3f}"
+        )
+        return blended
+
+    @classmethod
+    def _dampen_numeric_drift(
+        cls, aggregate: NumericDistribution, question: NumericQuestion
+    ) -> NumericDistribution:
+        assert question.previous_forecasts
+        prev_points = question.previous_forecasts[-1].declared_percentiles
+        new_points = aggregate.declared_percentiles
+
+        # Compare interpolated medians to decide if dampening is needed,
+        # since the two forecasts need not declare the same percentiles
+        prev_median = _interpolate_median(prev_points)
+        new_median = _interpolate_median(new_points)
+        range_span = question.upper_bound - question.lower_bound
+        if range_span <= 0:
+            return aggregate
+        relative_drift = abs(new_median - prev_median) / range_span
+        if relative_drift <= MAX_NUMERIC_DRIFT:
+            return aggregate
+
+        percentiles = np.array([p.percentile for p in new_points])
+        new_values = np.array([p.value for p in new_points])
+        prev_values = np.interp(
+            percentiles,
+            [p.percentile for p in prev_points],
+            [p.value for p in prev_points],
+        )
+        blended_values = NEW_WEIGHT * new_values + (1 - NEW_WEIGHT) * prev_values
+        blended = [
+            Percentile(percentile=percentile, value=value)
+            for percentile, value in zip(percentiles.tolist(), blended_values.tolist())
+        ]
+        logger.info(
+            f"Drift guard: numeric drift {relative_drift:.3f} "
+            f"exceeded {MAX_NUMERIC_DRIFT}, blended CDF"
+        )
+        return NumericDistribution.from_question(blended, question)
+
     async def run_research(self, question: MetaculusQuestion) -> str:
         async with self._concurrency_limiter:
-            # Streams A (LLM-only), B (AskNews), D (LLM-only) in parallel
+            # Streams A (LLM-only), B (AskNews), C (AskNews), D (LLM-only)
+            # in parallel
             drivers_task = DriversResearcher.research_drivers(question)
             key_factors_task = KeyFactorsResearcher.find_and_sort_key_factors(
                 question,
                 num_key_factors_to_return=5,
                 num_questions_to_research_with=10,
             )
-            base_rates_task = LightweightBaseRateResearcher.research_base_rates(question)
+            base_rates_task = LightweightBaseRateResearcher.research_base_rates(
+                question
+            )
+            news_task = self._get_latest_news(question)
 
             results = await asyncio.gather(
                 drivers_task,
                 key_factors_task,
                 base_rates_task,
+                news_task,
                 return_exceptions=True,
             )
 
@@ -204,14 +206,14 @@ class DriversBot(SpringTemplateBot2026):
                         + "\n\n"
                     )
 
-            # Stream C: Latest News
+            # Process Stream C results (latest news)
             news_section = ""
-            try:
-                news_section = await AskNewsSearcher().get_formatted_news_async(
-                    question.question_text
+            if isinstance(results[3], BaseException):
+                logger.warning(
+                    f"AskNews research failed: {results[3]}", exc_info=results[3]
                 )
-            except Exception as e:
-                logger.warning(f"AskNews research failed: {e}", exc_info=True)
+            else:
+                news_section = results[3]
 
             research = (
                 drivers_section
@@ -219,7 +221,8 @@ class DriversBot(SpringTemplateBot2026):
                 + base_rates_section
                 + news_section
             )
-            logger.info(
-                f"Found Research for URL {question.page_url}:\n{research}"
-            )
+            logger.info(f"Found Research for URL {question.page_url}:\n{research}")
             return research
+
+    async def _get_latest_news(self, question: MetaculusQuestion) -> str:
+        return await AskNewsSearcher().get_formatted_news_async(question.question_text)
@@ -117,10 +117,11 @@ class ForecastBot(ABC):
         self.required_successful_predictions: float = required_successful_predictions
         self._note_pads: list[Notepad] = []
         self._note_pad_lock = asyncio.Lock()
-        self._llms = llms or self._llm_config_defaults()
+        default_llms = self._llm_config_defaults()
+        self._llms = llms or default_llms
         self.metaculus_client = metaculus_client or MetaculusClient()
 
-        for purpose, llm in self._llm_config_defaults().items():
+        for purpose, llm in default_llms.items():
             if purpose not in self._llms:
                 logger.warning(
                     f"User forgot to set an llm for purpose: '{purpose}'. Using default llm: "
@@ -130,7 +131,7 @@ class ForecastBot(ABC):
                 self._llms[purpose] = llm
 
         for purpose, llm in self._llms.items():
-            if purpose not in self._llm_config_defaults():
+            if purpose not in default_llms:
                 logger.warning(
                     f"There is no default for llm: '{purpose}'."
                     f"Please override and add it to the {self._llm_config_defaults.__name__} method"